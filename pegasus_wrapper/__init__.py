@@ -38,12 +38,15 @@ def initialize_vista_pegasus_wrapper(parameters: Parameters) -> None:
     _SINGLETON_WORKFLOW_BUILDER = WorkflowBuilder.from_parameters(parameters)
 
 
-def _assert_singleton_workflow_builder() -> None:
-    if not _SINGLETON_WORKFLOW_BUILDER:
+def _singleton_workflow_builder() -> WorkflowBuilder:
+    # Read the global once so each wrapper checks and uses the same binding.
+    workflow_builder = _SINGLETON_WORKFLOW_BUILDER
+    if workflow_builder is None:
         raise RuntimeError(
             "You must call initialize_vista_pegasus_wrapper(params) "
             "before calling any other wrapper functions."
         )
+    return workflow_builder
 
 
 def directory_for(locator: Locator) -> Path:
@@ -51,8 +54,7 @@ def directory_for(locator: Locator) -> Path:
     Get the suggested working/output directory
     for a job with the given `Locator`.
     """
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.directory_for(locator)
+    return _singleton_workflow_builder().directory_for(locator)
 
 
 def run_python_on_parameters(
@@ -82,8 +84,7 @@ def run_python_on_parameters(
     This method returns a `DependencyNode` which can be used in *depends_on*
     for future jobs.
     """
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.run_python_on_parameters(
+    return _singleton_workflow_builder().run_python_on_parameters(
         job_name=job_name,
         python_module=python_module,
         parameters=parameters,
@@ -106,8 +107,7 @@ def limit_jobs_for_category(category: str, max_jobs: int):
     """
     Limit the number of jobs in the given category that can run concurrently to max_jobs.
     """
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.limit_jobs_for_category(category, max_jobs)
+    return _singleton_workflow_builder().limit_jobs_for_category(category, max_jobs)
 
 
 def run_python_on_args(
@@ -139,8 +139,7 @@ def run_python_on_args(
     This method returns a `DependencyNode` which can be used in *depends_on*
     for future jobs.
     """
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.run_python_on_args(
+    return _singleton_workflow_builder().run_python_on_args(
         job_name=job_name,
         python_module_or_path=python_module_or_path,
         set_args=set_args,
@@ -178,8 +177,7 @@ def run_container(
     times_to_retry_job: int = 0,
     job_profiles: Iterable[PegasusProfile] = immutableset(),
 ) -> DependencyNode:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.run_container(
+    return _singleton_workflow_builder().run_container(
         job_name=job_name,
         docker_image_name=docker_image_name,
         docker_args=docker_args,
@@ -198,13 +196,11 @@ def run_container(
 
 
 def default_conda_configuration() -> CondaConfiguration:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.default_conda_configuration()
+    return _singleton_workflow_builder().default_conda_configuration()
 
 
 def write_workflow_description(output_xml_dir: Optional[Path] = None) -> Path:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.write_dax_to_dir(output_xml_dir)
+    return _singleton_workflow_builder().write_dax_to_dir(output_xml_dir)
 
 
 def add_container(
@@ -219,8 +215,7 @@ def add_container(
     metadata: Optional[Mapping[str, Union[float, int, str]]] = None,
     bypass_staging: bool = False,
 ) -> Container:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.add_container(
+    return _singleton_workflow_builder().add_container(
         container_name,
         container_type,
         image,
@@ -247,8 +242,7 @@ def run_bash(
     container: Optional[Container] = None,
     path_to_bash: Path = BASH_EXECUTABLE_PATH,
 ) -> DependencyNode:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.run_bash(
+    return _singleton_workflow_builder().run_bash(
         job_name,
         command,
         depends_on=depends_on,
@@ -271,8 +265,7 @@ def start_docker_as_service(
     docker_args: str = "",
     resource_request: Optional[ResourceRequest] = None,
 ) -> DependencyNode:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.start_docker_as_service(
+    return _singleton_workflow_builder().start_docker_as_service(
         container=container,
         depends_on=depends_on,
         mounts=mounts,
@@ -287,8 +280,7 @@ def stop_docker_as_service(
     depends_on,
     resource_request: Optional[ResourceRequest] = None,
 ) -> DependencyNode:
-    _assert_singleton_workflow_builder()
-    return _SINGLETON_WORKFLOW_BUILDER.stop_docker_as_service(
+    return _singleton_workflow_builder().stop_docker_as_service(
         container=container, depends_on=depends_on, resource_request=resource_request
     )
 
@@ -298,7 +290,6 @@ def experiment_directory() -> Path:
     The directory to which the Pegasus DAX for this experiment will be written.
     Typically all experiment outputs will be written within this directory as well.
     """
-    _assert_singleton_workflow_builder()
     return (
-        _SINGLETON_WORKFLOW_BUILDER._workflow_directory  # pylint:disable=protected-access
+        _singleton_workflow_builder()._workflow_directory  # pylint:disable=protected-access
     )
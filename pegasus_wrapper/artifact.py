@@ -3,21 +3,23 @@ Some specialized artifacts already exist:
 * If storing a file path to a ZIP store see `ZipKeyValueStore`
 """
 
-from typing import Generic, Iterable, Optional, Sequence, TypeVar
+from typing import Generic, Iterable, List, Optional, TypeVar
 
 from attr import attrib, attrs
-from attr.validators import instance_of, optional
+from attr.validators import deep_iterable, instance_of, optional
 
 from immutablecollections import ImmutableSet, immutableset
 
 from pegasus_wrapper.locator import Locator
 
-from more_itertools import collapse
 from Pegasus.api import File, Job
-from typing_extensions import Protocol
 
+# Shared by every node and artifact with no dependencies or output files,
+# and recognized by identity in `_canonicalize_depends_on`.
+_EMPTY_SET: ImmutableSet = immutableset()
 
-@attrs(slots=True, eq=False)
+
+@attrs(slots=True, frozen=True, eq=False)
 class DependencyNode:
     """
     An abstract object tied to a computation
@@ -26,24 +28,28 @@ class DependencyNode:
     depends on the output of another computation.
     """
 
-    job: Optional[Job] = attrib(validator=optional(instance_of(Job)), kw_only=True)
+    job: Optional[Job] = attrib(kw_only=True)
+    # checkpointed files for a job
     output_files: ImmutableSet[File] = attrib(
-        validator=instance_of(ImmutableSet), kw_only=True
-    )  # checkpointed files for a job
+        validator=deep_iterable(instance_of(File), instance_of(ImmutableSet)),
+        kw_only=True,
+    )
+    # A node is often passed directly as the depends_on of many jobs,
+    # so the set containing just this node is built once, on first use.
+    _singleton_set: Optional[ImmutableSet["DependencyNode"]] = attrib(
+        init=False, default=None, repr=False
+    )
 
     @staticmethod
     def from_job(job: Job, output_files: Optional[Iterable[File]]) -> "DependencyNode":
-        return DependencyNode(
-            job=job,
-            output_files=immutableset(output_files) if output_files else immutableset(),
-        )
+        return DependencyNode(job=job, output_files=immutableset(output_files or ()))
 
     @staticmethod
     def already_done() -> "DependencyNode":
-        return DependencyNode(job=None, output_files=immutableset())
+        return DependencyNode(job=None, output_files=_EMPTY_SET)
 
 
-class Artifact(Protocol):
+class Artifact:
     r"""
     An `Artifact` is the result of any computation.
 
@@ -61,40 +67,75 @@ class Artifact(Protocol):
     but you can include the path where you know the result will be written.
     """
 
+    # Lets slotted implementations like `AbstractArtifact` avoid a per-instance __dict__.
+    __slots__ = ()
+
     depends_on: ImmutableSet[DependencyNode]
-    locator: Optional[Locator] = attrib(validator=optional(instance_of(Locator)))
+    locator: Optional[Locator]
 
 
-def _canonicalize_depends_on(
-    dep_param, *, max_depth: Optional[int] = None
-) -> Sequence[DependencyNode]:
-    """
-    For convenience, we allow specifying the depends_on parameter when submitting a job
-    in numerous ways.
+def _add_dependency_nodes(nodes: List[DependencyNode], item) -> bool:
+    r"""
+    Adds the `DependencyNode`\ s given by *item* to *nodes*
+    if it is a `DependencyNode` or `Artifact`.
+
+    Returns whether *item* was one of these.
     """
-    if max_depth is not None:
-        if isinstance(dep_param, DependencyNode):
-            return [dep_param]
-        elif isinstance(dep_param, Artifact):
-            return dep_param.depends_on
-        elif max_depth > 0:
-            return [
-                _canonicalize_depends_on(x, max_depth=max_depth - 1) for x in dep_param
-            ]
-        else:
-            raise RuntimeError("Error parsing dependency specification")
+    if isinstance(item, DependencyNode):
+        nodes.append(item)
+        return True
+    elif isinstance(item, Artifact):
+        nodes.extend(item.depends_on)
+        return True
     else:
-        return immutableset(collapse(_canonicalize_depends_on(dep_param, max_depth=2)))
+        return False
 
 
-@attrs(frozen=True)
+def _canonicalize_depends_on(dep_param) -> ImmutableSet[DependencyNode]:
+    """
+    For convenience, we allow specifying the depends_on parameter when submitting a job
+    in numerous ways.
+
+    It may be a `DependencyNode` or `Artifact`,
+    an iterable of these, or an iterable of iterables of these.
+    """
+    if dep_param is _EMPTY_SET:
+        return _EMPTY_SET
+    elif isinstance(dep_param, DependencyNode):
+        singleton_set = dep_param._singleton_set  # pylint:disable=protected-access
+        if singleton_set is None:
+            singleton_set = immutableset((dep_param,))
+            object.__setattr__(dep_param, "_singleton_set", singleton_set)
+        return singleton_set
+    elif isinstance(dep_param, Artifact):
+        # `immutableset` returns the artifact's own set if it already is one,
+        # as it is for all `AbstractArtifact`s.
+        return immutableset(dep_param.depends_on)
+    elif isinstance(dep_param, ImmutableSet) and all(
+        isinstance(item, DependencyNode) for item in dep_param
+    ):
+        # e.g. the `depends_on` of another artifact, which needs no flattening
+        return dep_param
+
+    nodes: List[DependencyNode] = []
+    # Only two levels of nesting are allowed, so flatten them with plain loops
+    # rather than recursing.
+    for item in dep_param:
+        if not _add_dependency_nodes(nodes, item):
+            for inner_item in item:
+                if not _add_dependency_nodes(nodes, inner_item):
+                    raise RuntimeError("Error parsing dependency specification")
+    return immutableset(nodes)
+
+
+@attrs(frozen=True, slots=True)
 class AbstractArtifact(Artifact):
     """
     A convenient base class for custom `Artifact` implementations.
     """
 
     depends_on: ImmutableSet[DependencyNode] = attrib(
-        converter=_canonicalize_depends_on, kw_only=True, default=immutableset()
+        converter=_canonicalize_depends_on, kw_only=True, default=_EMPTY_SET
     )
     locator: Optional[Locator] = attrib(
         validator=optional(instance_of(Locator)), kw_only=True, default=None
@@ -104,7 +145,7 @@ class AbstractArtifact(Artifact):
 _T = TypeVar("_T")
 
 
-@attrs(frozen=True)
+@attrs(frozen=True, slots=True)
 class ValueArtifact(AbstractArtifact, Generic[_T]):
     """
     An artifact which wraps a single value.
@@ -121,4 +162,4 @@ class ValueArtifact(AbstractArtifact, Generic[_T]):
     def preexisting(
         value: _T, *, locator: Optional[Locator] = None
     ) -> "ValueArtifact[_T]":
-        return ValueArtifact(value, depends_on=immutableset(), locator=locator)
+        return ValueArtifact(value, locator=locator)
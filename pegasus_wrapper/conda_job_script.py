@@ -1,4 +1,3 @@
-import stat
 from pathlib import Path
 from typing import Optional, Union
 
@@ -8,6 +7,8 @@ from attr.validators import instance_of, optional
 from vistautils.io_utils import CharSink
 from vistautils.parameters import Parameters, YAMLParametersWriter
 
+from pegasus_wrapper.pegasus_utils import _percent_template, write_executable_script
+
 from saga_tools.conda import CondaConfiguration
 from saga_tools.spack import SpackConfiguration
 
@@ -54,6 +55,16 @@ class CondaJobScriptGenerator:
     spack_config: Optional[SpackConfiguration] = attrib(
         validator=optional(instance_of(SpackConfiguration))
     )
+    # The environment setup lines are the same for every script this generates,
+    # so we render them once on construction.
+    _conda_lines: str = attrib(init=False, default="", eq=False, repr=False)
+    _spack_lines: str = attrib(init=False, default="", eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.conda_config:
+            object.__setattr__(self, "_conda_lines", self.conda_config.sbatch_lines())
+        if self.spack_config:
+            object.__setattr__(self, "_spack_lines", self.spack_config.sbatch_lines())
 
     @staticmethod
     def from_parameters(params: Parameters) -> "CondaJobScriptGenerator":
@@ -97,25 +108,22 @@ class CondaJobScriptGenerator:
                 f"Cmds: {cmd_args}"
             )
         if override_conda_config:
-            conda_config = override_conda_config
+            conda_lines = override_conda_config.sbatch_lines()
         else:
-            conda_config = self.conda_config
+            conda_lines = self._conda_lines
 
-        python_job = PYTHON_JOB.format(
+        ckpt_line = f"touch {ckpt_path.absolute()}" if ckpt_path else ""
+
+        return _CONDA_PYTHON_SCRIPT % dict(
+            conda_lines=conda_lines,
+            spack_lines=self._spack_lines,
+            working_directory=working_directory,
             path_or_entry_point=f"-m {entry_point_name}"
             if entry_point_name
             else python_path,
             param_file_or_args=param_file if param_file else cmd_args,
             python=python,
             stdout_file=stdout_file,
-        )
-        ckpt_line = f"touch {ckpt_path.absolute()}" if ckpt_path else ""
-
-        return CONDA_SCRIPT.format(
-            conda_lines=conda_config.sbatch_lines() if conda_config else "",
-            spack_lines=self.spack_config.sbatch_lines() if self.spack_config else "",
-            working_directory=working_directory,
-            python_job=python_job,
             ckpt_line="\n".join([f"echo {ckpt_line}", ckpt_line]),
             pre_job=pre_job,
             post_job=post_job,
@@ -164,7 +172,8 @@ class CondaJobScriptGenerator:
         if not stdout_file:
             stdout_file = working_directory / "___stdout.log"
 
-        script_path.write_text(
+        write_executable_script(
+            script_path,
             self.generate_shell_script(
                 entry_point_name=entry_point_name
                 if isinstance(entry_point_name, str)
@@ -182,10 +191,7 @@ class CondaJobScriptGenerator:
                 pre_job=pre_job,
                 post_job=post_job,
             ),
-            encoding="utf-8",
         )
-        # Mark the generated script as executable.
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
 
 
 CONDA_SCRIPT = """#!/usr/bin/env bash
@@ -210,7 +216,11 @@ cd {working_directory}
 {ckpt_line}
 """
 
-PYTHON_JOB = """echo `which {python}`
+PYTHON_JOB = """type -P {python} || true
 echo {python} {path_or_entry_point} {param_file_or_args}
 {python} {path_or_entry_point} {param_file_or_args} 2>&1 | tee {stdout_file}
 """
+
+# What `generate_shell_script` actually renders:
+# PYTHON_JOB spliced into CONDA_SCRIPT, so each script takes one formatting pass.
+_CONDA_PYTHON_SCRIPT = _percent_template(CONDA_SCRIPT.replace("{python_job}", PYTHON_JOB))
@@ -1,4 +1,3 @@
-import stat
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +6,8 @@ from attr.validators import instance_of, optional
 
 from vistautils.parameters import Parameters
 
+from pegasus_wrapper.pegasus_utils import _percent_template, write_executable_script
+
 from saga_tools.spack import SpackConfiguration
 
 
@@ -38,6 +39,12 @@ class DockerJobScriptGenerator:
     spack_config: Optional[SpackConfiguration] = attrib(
         validator=optional(instance_of(SpackConfiguration))
     )
+    # Filled in from spack_config by __attrs_post_init__.
+    _spack_lines: str = attrib(init=False, default="", eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.spack_config:
+            object.__setattr__(self, "_spack_lines", self.spack_config.sbatch_lines())
 
     @staticmethod
     def from_parameters(params: Parameters) -> "DockerJobScriptGenerator":
@@ -58,7 +65,8 @@ class DockerJobScriptGenerator:
         pre_job: str = "",
         post_job: str = "",
     ) -> None:
-        script_path.write_text(
+        write_executable_script(
+            script_path,
             self.generate_shell_script(
                 docker_image_name=docker_image_name,
                 docker_command=docker_command,
@@ -69,10 +77,7 @@ class DockerJobScriptGenerator:
                 pre_job=pre_job,
                 post_job=post_job,
             ),
-            encoding="utf-8",
         )
-        # Mark the generated script as executable.
-        script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
 
     def write_service_shell_script_to(
         self,
@@ -85,22 +90,20 @@ class DockerJobScriptGenerator:
         remove_docker_on_exit: bool = True,
     ) -> None:
 
-        start_script_path.write_text(
+        write_executable_script(
+            start_script_path,
             self.start_docker_script_text(
                 docker_container_name=docker_container_name,
                 docker_args=docker_args,
                 docker_img=docker_image_path,
                 remove_on_exit=remove_docker_on_exit,
             ),
-            encoding="utf-8",
         )
 
-        stop_script_path.write_text(
-            self.stop_docker_script_text(docker_container_name=docker_container_name)
+        write_executable_script(
+            stop_script_path,
+            self.stop_docker_script_text(docker_container_name=docker_container_name),
         )
-        # Mark the generated script as executable.
-        start_script_path.chmod(start_script_path.stat().st_mode | stat.S_IEXEC)
-        stop_script_path.chmod(stop_script_path.stat().st_mode | stat.S_IEXEC)
 
     def generate_shell_script(
         self,
@@ -122,18 +125,15 @@ class DockerJobScriptGenerator:
         for outputs which are time or resource intensive or can be shared across projects.
         Examples: Running BERT on all of Gigaword or Converting RDF triples to FlexNLP documents
         """
-        docker_job = DOCKER_JOB.format(
+        ckpt_line = f"touch {ckpt_path.absolute()}" if ckpt_path else ""
+
+        return _DOCKER_JOB_SCRIPT % dict(
+            spack_lines=self._spack_lines,
+            working_directory=working_directory,
             docker_image=f"{docker_image_name}",
             docker_args=cmd_args,
             docker_command=docker_command,
             docker_tar=docker_tar,
-        )
-        ckpt_line = f"touch {ckpt_path.absolute()}" if ckpt_path else ""
-
-        return DOCKER_SCRIPT.format(
-            spack_lines=self.spack_config.sbatch_lines() if self.spack_config else "",
-            working_directory=working_directory,
-            docker_job=docker_job,
             ckpt_line="\n".join([f"echo {ckpt_line}", ckpt_line]),
             pre_job=pre_job,
             post_job=post_job,
@@ -147,7 +147,7 @@ class DockerJobScriptGenerator:
         *,
         remove_on_exit: bool = True,
     ) -> str:
-        return DOCKER_START_SCRIPT.format(
+        return _DOCKER_START_SCRIPT % dict(
             docker_container_name=docker_container_name,
             docker_img=docker_img,
             args=docker_args,
@@ -155,7 +155,7 @@ class DockerJobScriptGenerator:
         )
 
     def stop_docker_script_text(self, docker_container_name: str) -> str:
-        return DOCKER_STOP_SCRIPT.format(docker_container_name=docker_container_name)
+        return _DOCKER_STOP_SCRIPT % dict(docker_container_name=docker_container_name)
 
 
 DOCKER_SCRIPT = """#!/usr/bin/env bash
@@ -199,3 +199,7 @@ else
   echo '{docker_container_name} is already up'
 fi
 """
+
+_DOCKER_JOB_SCRIPT = _percent_template(DOCKER_SCRIPT.replace("{docker_job}", DOCKER_JOB))
+_DOCKER_START_SCRIPT = _percent_template(DOCKER_START_SCRIPT)
+_DOCKER_STOP_SCRIPT = _percent_template(DOCKER_STOP_SCRIPT)
@@ -1,3 +1,4 @@
+from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
 
@@ -16,7 +17,7 @@ from pegasus_wrapper.locator import Locator
 from typing_extensions import Protocol
 
 
-class KeyValueStore(Artifact, Protocol):
+class KeyValueStore(Artifact, metaclass=ABCMeta):
     """
     A key-value store is any sort of a mapping between keys and values store in some manner.
 
@@ -29,11 +30,13 @@ class KeyValueStore(Artifact, Protocol):
     Note that a key-value store may be empty (store no mappings).
     """
 
+    @abstractmethod
     def input_parameters(self) -> Mapping[str, Any]:
         """
         Parameters to be passed to an entry point to use this key-value store as input.
         """
 
+    @abstractmethod
     def output_parameters(self) -> Mapping[str, Any]:
         """
         Parameters to be passed to an entry point to use this key-value stores as output.
@@ -259,16 +262,10 @@ def explicit_train_dev_test_split(
             },
             "must_be_exhaustive": exhaustive,
         },
-        depends_on=[corpus],
+        depends_on=[corpus, train_ids, dev_ids, test_ids],
     )
 
-    deps = [
-        corpus.depends_on,
-        split_job,
-        train_ids.depends_on,
-        dev_ids.depends_on,
-        test_ids.depends_on,
-    ]
+    deps = [corpus.depends_on, split_job]
 
     train_store = ZipKeyValueStore(train_zip, locator=train_locator, depends_on=deps)
     dev_store = ZipKeyValueStore(dev_zip, locator=dev_locator, depends_on=deps)
@@ -1,17 +1,22 @@
-from itertools import chain
 from typing import Iterable, Tuple, Union
 
 from attr import attrib, attrs
 
 
 def _parse_parts(string_or_sequence: Union[str, Iterable[str]]) -> Tuple[str]:
-    if isinstance(string_or_sequence, str):
+    # Tuples are immutable, so they can be used as-is without copying.
+    if type(string_or_sequence) is tuple:  # pylint:disable=unidiomatic-typecheck
+        return string_or_sequence
+    elif isinstance(string_or_sequence, str):
+        # Single-segment names are common for leaf jobs and need no splitting.
+        if "/" not in string_or_sequence:
+            return (string_or_sequence,)
         return tuple(string_or_sequence.split("/"))
     else:
         return tuple(string_or_sequence)
 
 
-@attrs(slots=True, frozen=True, repr=False)
+@attrs(slots=True, frozen=True, repr=False, cache_hash=True)
 class Locator:
     r"""
     A `Locator` is provides a structured name to a workflow task.
@@ -27,25 +32,36 @@ class Locator:
     """
 
     _parts: Tuple[str] = attrib(converter=_parse_parts)
+    # Locators are immutable, so we compute their string form once on construction
+    # rather than re-joining the parts every time a job name or directory is needed.
+    _str: str = attrib(init=False, default="", eq=False, repr=False)
 
-    @_parts.validator
-    def _validate_parts(self, _attr, parts):
-        if any("=" in part for part in parts):
+    def __attrs_post_init__(self) -> None:
+        joined = "/".join(self._parts)
+        # Checking the joined string scans all the parts in one go.
+        if "=" in joined:
             # Pegasus uses HTCondor which can't handle = in job names, so we
             # forbid them to avoid confusion
-            raise ValueError(f"Can't handle locator path containing =: `{parts}`.")
+            raise ValueError(f"Can't handle locator path containing =: `{self._parts}`.")
+        object.__setattr__(self, "_str", joined)
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        """
+        The individual components of this `Locator`, as with `Path.parts`.
+        """
+        return self._parts
 
     def __truediv__(self, other: Union[str, "Locator"]):
+        # Both branches hand the constructor a tuple, which it uses without copying.
         if isinstance(other, Locator):
-            return Locator(
-                chain(self._parts, other._parts)  # pylint:disable=protected-access
-            )
+            if not other._parts:  # pylint:disable=protected-access
+                return self
+            return Locator(self._parts + other._parts)  # pylint:disable=protected-access
         elif isinstance(other, str):
-            new_parts = list(self._parts)
-            new_parts.append(other)
-            return Locator(new_parts)
+            return Locator(self._parts + (other,))
         else:
             raise RuntimeError(f"Cannot extend a locator with a {type(other)}")
 
     def __repr__(self) -> str:
-        return "/".join(self._parts)
+        return self._str
@@ -1,3 +1,6 @@
+import os
+import re
+import stat
 from pathlib import Path
 
 from vistautils.parameters import Parameters
@@ -29,18 +32,72 @@ pegasus-plan \\
 """
 
 
+_FORMAT_TEMPLATE_TOKEN = re.compile(r"{{|}}|{(\w+)}|%|[{}]")
+
+
+def _percent_template(format_template: str) -> str:
+    """
+    Converts a `str.format` template whose fields are all of the plain ``{name}`` form
+    into the equivalent ``%(name)s`` template.
+    """
+    # Job script templates are public in `str.format` syntax,
+    # but we render them with %-formatting,
+    # which does these plain substitutions about twice as fast.
+
+    def convert(match) -> str:
+        token = match.group(0)
+        if match.group(1):
+            return f"%({match.group(1)})s"
+        elif token == "%":
+            return "%%"
+        elif token in ("{{", "}}"):
+            return token[0]
+        else:
+            raise ValueError(
+                f"Unsupported field at position {match.start()} "
+                f"of template {format_template!r}"
+            )
+
+    return _FORMAT_TEMPLATE_TOKEN.sub(convert, format_template)
+
+
+def write_executable_script(path: Path, content: str) -> None:
+    """
+    Writes *content* to *path* as a script which can be executed.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # Like `chmod u+x`: keep the mode the file has (for new files, per the umask)
+        # and only add owner execute.
+        os.fchmod(fd, os.fstat(fd).st_mode | stat.S_IEXEC)
+        script = open(fd, "w", encoding="utf-8")
+    except BaseException:
+        os.close(fd)
+        raise
+    with script:
+        script.write(content)
+
+
 def build_submit_script(path: Path, dax_file: str, workflow_directory: Path) -> None:
-    path.write_text(
-        SUBMIT_SCRIPT.format(workflow_directory=workflow_directory, dax_file=dax_file)
-    )
-    # Designate the submit script as executable
-    path.chmod(0o777)
+    with path.open("w") as submit_script:
+        # Designate the submit script as executable
+        # via the open file rather than a second lookup of the path
+        os.fchmod(submit_script.fileno(), 0o777)
+        submit_script.write(
+            SUBMIT_SCRIPT.format(workflow_directory=workflow_directory, dax_file=dax_file)
+        )
+
+
+def _home_dir(params: Parameters) -> str:
+    home = params.optional_string("home_dir")
+    # Only look up the user's home directory when it is actually needed.
+    return home if home is not None else str(Path.home().absolute())
 
 
 def add_local_nas_to_sites(
     sites_catalog: SiteCatalog, params: Parameters = Parameters.empty()
 ) -> None:
-    home = params.string("home_dir", default=str(Path.home().absolute()))
+    home = _home_dir(params)
     shared_scratch_dir = params.string(
         "local_shared_scratch", default=f"{home}/workflows/scratch"
     )
@@ -61,7 +118,7 @@ def add_local_nas_to_sites(
 def add_saga_cluster_to_sites(
     sites_catalog: SiteCatalog, params: Parameters = Parameters.empty()
 ) -> None:
-    home = params.string("home_dir", default=str(Path.home().absolute()))
+    home = _home_dir(params)
     data_configuration = params.string("data_configuration", default="sharedfs")
 
     shared_scratch_dir = params.string(
@@ -1,10 +1,11 @@
 import logging
 from abc import abstractmethod
-from typing import Optional
+from typing import Mapping, Optional
 
 from attr import attrib, attrs
 from attr.validators import in_, instance_of, optional
 
+from immutablecollections import immutabledict
 from vistautils.memory_amount import MemoryAmount
 from vistautils.parameters import Parameters
 from vistautils.range import Range
@@ -119,6 +120,14 @@ class SlurmResourceRequest(ResourceRequest):
     run_on_single_node: Optional[str] = attrib(
         validator=optional(instance_of(str)), kw_only=True, default=None
     )
+    # The SLURM arguments which come before and after the job name.
+    # These are fixed for a given request, so we compute them once on construction.
+    _slurm_args_prefix: str = attrib(init=False, default="", eq=False, repr=False)
+    _slurm_args_suffix: str = attrib(init=False, default="", eq=False, repr=False)
+    # Likewise for the Pegasus profile values other than the SLURM arguments.
+    _pegasus_profile_values: Mapping[str, str] = attrib(
+        init=False, factory=immutabledict, eq=False, repr=False
+    )
 
     def __attrs_post_init__(self):
         if not self.job_time_in_minutes:
@@ -138,6 +147,41 @@ class SlurmResourceRequest(ResourceRequest):
             # See https://www.attrs.org/en/stable/how-does-it-work.html#how-frozen
             object.__setattr__(self, "job_time_in_minutes", partition_job_time)
 
+        resources = dict(
+            num_cpus=self.num_cpus or 1,
+            num_gpus=self.num_gpus if self.num_gpus is not None else 0,
+            mem_str=to_slurm_memory_string(self.memory or _SLURM_DEFAULT_MEMORY),
+        )
+        slurm_args_prefix = _SLURM_RESOURCE_STRING_BEFORE_JOB_NAME.format(**resources)
+        slurm_args_suffix = _SLURM_RESOURCE_STRING_AFTER_JOB_NAME.format(**resources)
+
+        if self.exclude_list:
+            slurm_args_suffix += f" --exclude={self.exclude_list}"
+
+        if self.run_on_single_node:
+            slurm_args_suffix += f" --nodelist={self.run_on_single_node}"
+
+        if self.partition and self.partition.name in (SCAVENGE, EPHEMERAL):
+            slurm_args_suffix += f" --qos={self.partition.name}"
+
+        object.__setattr__(self, "_slurm_args_prefix", slurm_args_prefix)
+        object.__setattr__(self, "_slurm_args_suffix", slurm_args_suffix)
+
+        if self.partition:
+            object.__setattr__(
+                self,
+                "_pegasus_profile_values",
+                immutabledict(
+                    {
+                        "runtime": str(self.job_time_in_minutes * 60),
+                        "queue": self.partition.name,
+                        "project": _BORROWED_KEY
+                        if self.partition.name in (EPHEMERAL, SCAVENGE)
+                        else self.partition.name,
+                    }
+                ),
+            )
+
     @run_on_single_node.validator
     def check(self, _, value: str):
         if value and len(value.split(",")) != 1:
@@ -183,13 +227,6 @@ class SlurmResourceRequest(ResourceRequest):
                 f"Partition '{self.partition.name}' has a max walltime of {self.partition.max_walltime} mins, which is less than the time given ({self.job_time_in_minutes} mins) for job: {job_name}."
             )
 
-        slurm_resource_content = SLURM_RESOURCE_STRING.format(
-            num_cpus=self.num_cpus or 1,
-            num_gpus=self.num_gpus if self.num_gpus is not None else 0,
-            job_name=job_name,
-            mem_str=to_slurm_memory_string(self.memory or _SLURM_DEFAULT_MEMORY),
-        )
-
         if (
             self.exclude_list
             and self.run_on_single_node
@@ -199,31 +236,24 @@ class SlurmResourceRequest(ResourceRequest):
                 "the 'exclude_list' and 'run_on_single_node' options are not consistent."
             )
 
-        if self.exclude_list:
-            slurm_resource_content += f" --exclude={self.exclude_list}"
-
-        if self.run_on_single_node:
-            slurm_resource_content += f" --nodelist={self.run_on_single_node}"
-
-        if self.partition.name in (SCAVENGE, EPHEMERAL):
-            slurm_resource_content += f" --qos={self.partition.name}"
+        slurm_resource_content = (
+            f"{self._slurm_args_prefix}{job_name}{self._slurm_args_suffix}"
+        )
 
         job.add_pegasus_profile(
-            runtime=str(self.job_time_in_minutes * 60),
-            queue=str(self.partition.name),
-            project=_BORROWED_KEY
-            if self.partition.name in (EPHEMERAL, SCAVENGE)
-            else self.partition.name,
-            glite_arguments=slurm_resource_content,
+            glite_arguments=slurm_resource_content, **self._pegasus_profile_values
         )
 
-        if (
-            "dagman" not in job.profiles.keys()
-            or "CATEGORY" not in job.profiles["dagman"].keys()
-        ):
-            job.add_dagman_profile(category=str(self.partition))
+        if "CATEGORY" not in job.profiles.get("dagman", ()):
+            job.add_dagman_profile(category=self.partition.name)
 
 
 SLURM_RESOURCE_STRING = """--ntasks=1 --cpus-per-task={num_cpus} --gpus-per-task={num_gpus} --job-name={job_name} --mem={mem_str}"""
+# Only the job name differs between jobs with the same request,
+# so requests fill in the parts of SLURM_RESOURCE_STRING on either side of it up front.
+(
+    _SLURM_RESOURCE_STRING_BEFORE_JOB_NAME,
+    _SLURM_RESOURCE_STRING_AFTER_JOB_NAME,
+) = SLURM_RESOURCE_STRING.split("{job_name}")
 _BACKEND_PARAM = "backend"
 _BORROWED_KEY = "borrowed"
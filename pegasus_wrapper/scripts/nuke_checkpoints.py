@@ -8,18 +8,32 @@ to the generated DAX.
 If you want to force rerun of a job, apply this script to a directory.
 All checkpoints from that directory and its sub-directories will be removed.
 """
+import logging
 import sys
 from pathlib import Path
 
+
+def remove_checkpoints(root_dir: Path) -> int:
+    """
+    Remove all checkpoints in *root_dir* and its sub-directories.
+
+    Returns the number of checkpoints removed.
+    """
+    num_removed = 0
+    for ckpt_file in root_dir.rglob("___ckpt"):
+        logging.debug("Removing %s", ckpt_file)
+        ckpt_file.unlink()
+        num_removed += 1
+    return num_removed
+
+
 if __name__ == "__main__":
+    # Unlike when called from a workflow, report each checkpoint removed.
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     if len(sys.argv) != 2:
-        print(
+        logging.error(
             "Expected one argument, the root of the directory tree to clear checkpoints from"
         )
     root_dir = Path(sys.argv[1])  # pylint:disable=invalid-name
-    print(f"Removing checkpoints under {root_dir}")
-    for ckpt_file in root_dir.rglob("___ckpt"):
-        print(f"Removing {ckpt_file}")
-        ckpt_file.unlink()
-
-# Should we move this file to scripts?
+    logging.info("Removing checkpoints under %s", root_dir)
+    logging.info("Removed %s checkpoints", remove_checkpoints(root_dir))
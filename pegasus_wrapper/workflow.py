@@ -5,10 +5,11 @@ The user should typically not refer to these classes directly
 and should instead use the methods in the root of the package.
 """
 import logging
-import subprocess
+import os
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from attr import attrib, attrs
 from attr.validators import instance_of, optional
@@ -32,7 +33,7 @@ from pegasus_wrapper.pegasus_utils import (
     configure_saga_properities,
 )
 from pegasus_wrapper.resource_request import ResourceRequest
-from pegasus_wrapper.scripts import nuke_checkpoints
+from pegasus_wrapper.scripts.nuke_checkpoints import remove_checkpoints
 
 from Pegasus.api import (
     OS,
@@ -54,6 +55,13 @@ DOCKERMOUNT_SCRATCH_PATH_ROOT = Path("/scratch/dockermount/")
 BASH_EXECUTABLE_PATH = Path("/usr/bin/bash")
 PYTHON_EXECUTABLE_DOCKER_PATH = Path("/usr/local/bin/python")
 DOCKER_MOUNT_ROOT = Path("/data/")
+# Workflow descriptions and catalogs are emitted as many small writes,
+# so give their files a large buffer to reduce the number of write syscalls.
+_CATALOG_WRITE_BUFFER_SIZE = 1 << 20
+# Workflows typically schedule many jobs against a handful of entry point modules,
+# so remember the names we have already resolved.
+# Keying on the module itself rather than its id() keeps the cache safe from id reuse.
+_cached_fully_qualified_name = lru_cache(maxsize=None)(fully_qualified_name)
 
 _STR_TO_CONTAINER_TYPE = immutabledict(
     {
@@ -64,6 +72,11 @@ _STR_TO_CONTAINER_TYPE = immutabledict(
 )
 
 
+def _absolute_if_path(path: Any) -> Any:
+    # Non-paths are passed through for the validator to reject.
+    return path.absolute() if isinstance(path, Path) else path
+
+
 @attrs(frozen=True, slots=True)
 class WorkflowBuilder:
     """
@@ -78,7 +91,11 @@ class WorkflowBuilder:
 
     name: str = attrib(validator=instance_of(str), kw_only=True)
     created_by: str = attrib(validator=instance_of(str), kw_only=True)
-    _workflow_directory: Path = attrib(validator=instance_of(Path), kw_only=True)
+    # Made absolute once here so the many paths derived from it
+    # are already absolute when job scripts and catalogs call `absolute()` on them.
+    _workflow_directory: Path = attrib(
+        converter=_absolute_if_path, validator=instance_of(Path), kw_only=True
+    )
     _namespace: str = attrib(validator=instance_of(str), kw_only=True)
     _data_configuration: str = attrib(validator=instance_of(str), kw_only=True)
     _default_site: str = attrib(validator=instance_of(str), kw_only=True)
@@ -101,8 +118,6 @@ class WorkflowBuilder:
     # in the workflow graph. We compute this based on a job signature
     # and only actually schedule the job once.
     _signature_to_job: Dict[Any, DependencyNode] = attrib(init=False, factory=dict)
-    # Files already added to the job graph
-    _added_files: Set[File] = attrib(init=False, factory=set)
     # Replica Catalog created via API
     # Files are added here now not the job graph
     _replica_catalog: ReplicaCatalog = attrib(init=False, factory=ReplicaCatalog)
@@ -135,6 +150,14 @@ class WorkflowBuilder:
     _container_to_start_stop_job: Dict[Container, Tuple[Job, Job]] = attrib(
         kw_only=True, factory=dict
     )
+    # Jobs typically share a handful of distinct resource requests,
+    # so we unify each with the default only once.
+    _resource_request_to_unified: Dict[ResourceRequest, ResourceRequest] = attrib(
+        init=False, factory=dict
+    )
+    # The same locators are asked for repeatedly while building a workflow,
+    # so we only create each job directory once.
+    _locator_to_directory: Dict[Locator, Path] = attrib(init=False, factory=dict)
 
     @staticmethod
     def from_parameters(params: Parameters) -> "WorkflowBuilder":
@@ -170,8 +193,23 @@ class WorkflowBuilder:
         Get the suggested working/output directory
         for a job with the given `Locator`.
         """
-        ret = self._workflow_directory / str(locator)
-        ret.mkdir(parents=True, exist_ok=True)
+        ret = self._locator_to_directory.get(locator)
+        if ret is None:
+            ret = self._workflow_directory.joinpath(*locator.parts)
+            # A part starting with "/" makes `joinpath` discard the workflow directory,
+            # and ".." parts can climb out of it.
+            workflow_directory = Path(os.path.normpath(self._workflow_directory))
+            normalized = Path(os.path.normpath(ret))
+            if (
+                normalized != workflow_directory
+                and workflow_directory not in normalized.parents
+            ):
+                raise ValueError(
+                    f"Locator {locator} names a directory outside "
+                    f"the workflow directory {self._workflow_directory}"
+                )
+            ret.mkdir(parents=True, exist_ok=True)
+            self._locator_to_directory[locator] = ret
         return ret
 
     def _job_name_for(self, locator: Locator) -> str:
@@ -195,7 +233,8 @@ class WorkflowBuilder:
         If the file already exists, return the file otherwise create a new one.
         To just retrieve a previously created file see `get_file`
         """
-        if logical_file_name not in self._lfn_to_file:
+        f = self._lfn_to_file.get(logical_file_name)
+        if f is None:
             f = File(logical_file_name)
             f.add_metadata(creator=self.created_by)
             if add_to_catalog:
@@ -205,19 +244,20 @@ class WorkflowBuilder:
                     str(physical_file_path),
                 )
             self._lfn_to_file[logical_file_name] = f
-        return self._lfn_to_file[logical_file_name]
+        return f
 
     def get_file(self, logical_file_name: str) -> File:
         """
         Get a Pegasus File object for a given logical file,
         if it doesn't already exist raise an error.
         """
-        if logical_file_name not in self._lfn_to_file:
+        f = self._lfn_to_file.get(logical_file_name)
+        if f is None:
             raise RuntimeError(
                 f"Asked to retrive file name {logical_file_name} but "
                 f"this file did not already exist."
             )
-        return self._lfn_to_file[logical_file_name]
+        return f
 
     def _define_transformation(
         self,
@@ -234,9 +274,7 @@ class WorkflowBuilder:
         os_type: Optional[OS] = None,
     ) -> PegasusTransformation:
         # Try to see if we have the target transformation already made
-        for transformation in self._transformation_name_to_transformations.get(
-            name, immutableset()
-        ):
+        for transformation in self._transformation_name_to_transformations.get(name, ()):
             if transformation.container == container:
                 return transformation
         # Otherwise make the transformation and return it
@@ -272,7 +310,7 @@ class WorkflowBuilder:
         ckpt_name: Locator,
         depends_on,
         job: Job,
-        job_name: Locator,
+        pegasus_job_name: str,
         job_profiles: Iterable[PegasusProfile],
         resource_request: ResourceRequest,
         times_to_retry_job: int,
@@ -281,11 +319,12 @@ class WorkflowBuilder:
         Apply a variety of shared settings to a job.
 
         Centralized logic for multiple job types to use.
+        *pegasus_job_name* is the result of `_job_name_for` on the job's `Locator`.
         """
         self._job_graph.add_jobs(job)
 
         # Configure SLURM resource request
-        resource_request.apply_to_job(job, job_name=self._job_name_for(job_name))
+        resource_request.apply_to_job(job, job_name=pegasus_job_name)
 
         # Set the DAGMAN category to potentially limit the number of active jobs
         job.add_dagman_profile(category=category, retry=str(times_to_retry_job))
@@ -295,11 +334,17 @@ class WorkflowBuilder:
             job.add_profiles(profile.namespace, key=profile.key, value=profile.value)
 
         # Handle depedent job additions from the `depends_on` variable
+        # Collect everything first so the edges and inputs are each added in one call.
+        parent_jobs = []
+        parent_output_files = []
         for parent_dependency in depends_on:
             if parent_dependency.job:
-                self._job_graph.add_dependency(job, parents=[parent_dependency.job])
-            for out_file in parent_dependency.output_files:
-                job.add_inputs(out_file)
+                parent_jobs.append(parent_dependency.job)
+            parent_output_files.extend(parent_dependency.output_files)
+        if parent_jobs:
+            self._job_graph.add_dependency(job, parents=parent_jobs)
+        if parent_output_files:
+            job.add_inputs(*parent_output_files)
 
         # Handle Output Files
         # This is currently only handled as the checkpoint file
@@ -338,16 +383,13 @@ class WorkflowBuilder:
         """
         Internal function to schedule a python job for centralized logic.
         """
-        job_dir = self.directory_for(job_name)
-        ckpt_name = job_name / "___ckpt"
-        checkpoint_path = job_dir / "___ckpt"
         signature_args = None
         depends_on = _canonicalize_depends_on(depends_on)
 
         if isinstance(python_module_or_path, (str, Path)):
             computed_module_or_path = python_module_or_path
         else:
-            computed_module_or_path = fully_qualified_name(python_module_or_path)
+            computed_module_or_path = _cached_fully_qualified_name(python_module_or_path)
 
         if not isinstance(args_or_params, str):
             # allow users to specify the parameters as a dict for convenience
@@ -385,15 +427,27 @@ class WorkflowBuilder:
                 job_profiles=job_profiles,
             )
 
+        # Only build the job's paths (and create its directory) once we know
+        # this is a new job which is not handled by the container logic.
+        job_dir = self.directory_for(job_name)
+        ckpt_name = job_name / "___ckpt"
+        checkpoint_path = job_dir / "___ckpt"
         script_path = job_dir / "___run.sh"
         stdout_path = job_dir / "___stdout.log"
+        params_path: Optional[Path] = job_dir / "____params.params"
+        if signature_args is not None:
+            # We already serialized the parameters to compute the job signature,
+            # so write that out directly rather than serializing them a second time.
+            params_path.write_text(signature_args, encoding="utf-8")
+            args_or_params = params_path
+            params_path = None
 
         self._conda_script_generator.write_shell_script_to(
             entry_point_name=computed_module_or_path,
             parameters=args_or_params,
             working_directory=job_dir,
             script_path=script_path,
-            params_path=job_dir / "____params.params",
+            params_path=params_path,
             stdout_file=stdout_path,
             ckpt_path=checkpoint_path,
             override_conda_config=override_conda_config,
@@ -403,8 +457,9 @@ class WorkflowBuilder:
             treat_params_as_cmd_args=treat_params_as_cmd_args,
         )
 
+        pegasus_job_name = self._job_name_for(job_name)
         script_executable = Transformation(
-            self._job_name_for(job_name),
+            pegasus_job_name,
             namespace=self._namespace,
             version="4.0",
             site=self._default_site,
@@ -426,7 +481,7 @@ class WorkflowBuilder:
             ckpt_name,
             depends_on,
             job,
-            job_name,
+            pegasus_job_name,
             job_profiles,
             resource_request,
             times_to_retry_job,
@@ -463,9 +518,9 @@ class WorkflowBuilder:
         """
         # Ensure the input and output files are iterables of Path or str
         if isinstance(input_files, (Path, str)):
-            input_files = immutableset([input_files])
+            input_files = (input_files,)
         if isinstance(output_files, (Path, str)):
-            output_files = immutableset([output_files])
+            output_files = (output_files,)
         # A set to keep track of all the file names that will be created or copied into
         # The mounted directory. We use this to raise errors if a duplicate name would appear
         params_file_name = "____params.params"
@@ -525,15 +580,14 @@ class WorkflowBuilder:
             mutable_params = dict(python_args_or_parameters.as_mapping())
             for key, value in python_args_or_parameters.as_mapping().items():
                 if isinstance(value, Path):
-                    if str(value.absolute()) in converted_input_files:
+                    absolute_value = str(value.absolute())
+                    if absolute_value in converted_input_files:
                         mutable_params[key] = str(
-                            converted_input_files[str(value.absolute())].docker.absolute()
+                            converted_input_files[absolute_value].docker.absolute()
                         )
-                    elif str(value.absolute()) in converted_output_files:
+                    elif absolute_value in converted_output_files:
                         mutable_params[key] = str(
-                            converted_output_files[
-                                str(value.absolute())
-                            ].docker.absolute()
+                            converted_output_files[absolute_value].docker.absolute()
                         )
             modified_params = Parameters.from_mapping(mutable_params)
             params_path = job_dir / params_file_name
@@ -668,8 +722,9 @@ class WorkflowBuilder:
         # TODO - Refactor this so it uses the BASH transformation to form a job
         # With the script path as an argument
         # https://github.com/isi-vista/vista-pegasus-wrapper/issues/103
+        pegasus_job_name = self._job_name_for(job_name)
         script_executable = Transformation(
-            self._job_name_for(job_name),
+            pegasus_job_name,
             namespace=self._namespace,
             version="4.0",
             site=self._default_site,
@@ -690,7 +745,7 @@ class WorkflowBuilder:
             ckpt_name,
             depends_on,
             job,
-            job_name,
+            pegasus_job_name,
             job_profiles,
             resource_request,
             times_to_retry_job,
@@ -838,9 +893,8 @@ class WorkflowBuilder:
         if isinstance(command, str):
             command = [command]
 
-        commands_hashable = immutableset(command)
-
-        signature = (job_name, commands_hashable)
+        # The commands are only needed as a hashable key, in the order they will run.
+        signature = (job_name, tuple(command))
         if signature in self._signature_to_job:
             logging.info("Job %s recognized as duplicate", job_name)
             return self._signature_to_job[signature]
@@ -876,7 +930,7 @@ class WorkflowBuilder:
             ckpt_name,
             depends_on,
             bash_job,
-            job_name,
+            self._job_name_for(job_name),
             job_profiles,
             resource_request,
             times_to_retry_job,
@@ -900,14 +954,14 @@ class WorkflowBuilder:
         Start a docker image as a service
         """
         if isinstance(mounts, str):
-            mounts = immutableset(mounts)
+            mounts = (mounts,)
 
         container_loc = Locator(("containers", container.name))
         container_dir = self.directory_for(container_loc)
         container_start_path = container_dir / "start.sh"
         container_stop_path = container_dir / "stop.sh"
 
-        docker_args += " -v ".join(mounts)
+        docker_args += "".join(f" -v {mount}" for mount in mounts)
 
         self._docker_script_generator.write_service_shell_script_to(
             container.name,
@@ -995,12 +1049,14 @@ class WorkflowBuilder:
         return container
 
     def set_resource_request(self, resource_request: ResourceRequest):
-        if resource_request is not None:
-            resource_request = self.default_resource_request.unify(resource_request)
-        else:
-            resource_request = self.default_resource_request
+        if resource_request is None:
+            return self.default_resource_request
 
-        return resource_request
+        unified = self._resource_request_to_unified.get(resource_request)
+        if unified is None:
+            unified = self.default_resource_request.unify(resource_request)
+            self._resource_request_to_unified[resource_request] = unified
+        return unified
 
     def limit_jobs_for_category(self, category: str, max_jobs: int):
         """
@@ -1016,21 +1072,18 @@ class WorkflowBuilder:
             self._properties[f"dagman.{category}.maxjobs"] = str(max_jobs)
 
     def _nuke_checkpoints_and_clear_rc(self, output_xml_dir: Path) -> None:
-        subprocess.run(
-            ["python", nuke_checkpoints.__file__, output_xml_dir],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="utf-8",
-            check=True,
-        )
+        # Done in-process rather than by launching the `nuke_checkpoints` script,
+        # which paid for a fresh interpreter start-up just to delete some files.
+        num_removed = remove_checkpoints(output_xml_dir)
+        logging.info("Removed %s checkpoints under %s", num_removed, output_xml_dir)
         self._replica_catalog.write()
 
     def write_dax_to_dir(self, output_xml_dir: Optional[Path] = None) -> Path:
         if not output_xml_dir:
             output_xml_dir = self._workflow_directory
 
-        num_jobs = len(self._job_graph.jobs.keys())
-        num_ckpts = len([ckpt_file for ckpt_file in output_xml_dir.rglob("___ckpt")])
+        num_jobs = len(self._job_graph.jobs)
+        num_ckpts = sum(1 for _ in output_xml_dir.rglob("___ckpt"))
         if num_jobs == num_ckpts:
             nuke = input(
                 "DAX *may* create a NOOP workflow. Do you want to nuke the checkpoints and regenerate? [y/n]"
@@ -1042,7 +1095,7 @@ class WorkflowBuilder:
         dax_file_name = f"{self.name}.dax"
         dax_file = output_xml_dir / dax_file_name
         logging.info("Writing DAX to %s", dax_file)
-        with dax_file.open("w") as dax:
+        with dax_file.open("w", buffering=_CATALOG_WRITE_BUFFER_SIZE) as dax:
             self._job_graph.write(dax)
         build_submit_script(
             output_xml_dir / "submit.sh", dax_file_name, self._workflow_directory
@@ -1050,13 +1103,15 @@ class WorkflowBuilder:
 
         # Write Out Sites Catalog
         sites_yml_path = output_xml_dir / "sites.yml"
-        with sites_yml_path.open("w") as sites:
+        with sites_yml_path.open("w", buffering=_CATALOG_WRITE_BUFFER_SIZE) as sites:
             self._sites_catalog.write(sites)
         self._properties["pegasus.catalog.site.file"] = str(sites_yml_path.absolute())
 
         # Write Out Replica Catalog
         replica_yml_path = output_xml_dir / "replicas.yml"
-        with replica_yml_path.open("w") as replicas:
+        with replica_yml_path.open(
+            "w", buffering=_CATALOG_WRITE_BUFFER_SIZE
+        ) as replicas:
             self._replica_catalog.write(replicas)
         self._properties["pegasus.catalog.replica"] = "YAML"
         self._properties["pegasus.catalog.replica.file"] = str(
@@ -1065,7 +1120,9 @@ class WorkflowBuilder:
 
         # Write Out Transformation Catalog
         transformation_yml_path = output_xml_dir / "transformations.yml"
-        with transformation_yml_path.open("w") as transformations:
+        with transformation_yml_path.open(
+            "w", buffering=_CATALOG_WRITE_BUFFER_SIZE
+        ) as transformations:
             self._transformation_catalog.write(transformations)
         self._properties["pegasus.catalog.transformation"] = "YAML"
         self._properties["pegasus.catalog.transformation.file"] = str(
@@ -1085,6 +1142,8 @@ class WorkflowBuilder:
 
     @_job_graph.default
     def _init_job_graph(self) -> Workflow:
-        ret = Workflow(self.name)
+        # Every parent edge is added explicitly in `_update_job_settings`,
+        # so skip Pegasus' extra pass inferring the same edges from job files on write.
+        ret = Workflow(self.name, infer_dependencies=False)
         ret.add_metadata(name=self.name, createdby=self.created_by)
         return ret
@@ -25,8 +25,7 @@ setup(
         "importlib-resources==1.4.0",
 	    "vistautils>=0.21.0",
         "gitpython>=3.1.12",
-        "pegasus-wms.api==5.0.0",
-        "more_itertools>=8.2.0"
+        "pegasus-wms.api==5.0.0"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
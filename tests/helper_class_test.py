@@ -1,9 +1,50 @@
+from string import Formatter
+
+from immutablecollections import immutableset
+
 from pegasus_wrapper import PegasusProfile
+from pegasus_wrapper.artifact import DependencyNode
+from pegasus_wrapper.conda_job_script import CONDA_SCRIPT, PYTHON_JOB
+from pegasus_wrapper.docker_job_script import (
+    DOCKER_JOB,
+    DOCKER_SCRIPT,
+    DOCKER_START_SCRIPT,
+    DOCKER_STOP_SCRIPT,
+)
+from pegasus_wrapper.pegasus_utils import _percent_template
 
-from Pegasus.api import Namespace
+import pytest
+from Pegasus.api import File, Namespace
 
 
 def test_pegasus_profile():
     profile = PegasusProfile(namespace="dagman", key="key", value="value")
 
     assert str(profile) == f"({Namespace.DAGMAN}, key=key, value=value)"
+
+
+def test_percent_template_renders_like_format():
+    for template in (
+        CONDA_SCRIPT,
+        PYTHON_JOB,
+        DOCKER_SCRIPT,
+        DOCKER_JOB,
+        DOCKER_START_SCRIPT,
+        DOCKER_STOP_SCRIPT,
+    ):
+        values = {
+            field: f"{field} {{braces}} 100% %(x)s"
+            for _, field, _, _ in Formatter().parse(template)
+            if field
+        }
+        assert _percent_template(template) % values == template.format(**values)
+
+
+def test_dependency_node_validates_output_files():
+    output_file = File("output.txt")
+    node = DependencyNode(job=None, output_files=immutableset([output_file]))
+    assert node.output_files == immutableset([output_file])
+
+    for bad_output_files in ([output_file], output_file, immutableset(["output.txt"])):
+        with pytest.raises(TypeError):
+            DependencyNode(job=None, output_files=bad_output_files)
@@ -1,11 +1,21 @@
 from vistautils.parameters import Parameters
 
-from pegasus_wrapper import initialize_vista_pegasus_wrapper
+from pegasus_wrapper import (
+    initialize_vista_pegasus_wrapper,
+    run_python_on_parameters,
+    write_workflow_description,
+)
+from pegasus_wrapper.artifact import ValueArtifact
 from pegasus_wrapper.key_value import (
+    ZipKeyValueStore,
     compose_key_value_store_transforms,
+    explicit_train_dev_test_split,
     transform_key_value_store,
 )
 from pegasus_wrapper.locator import Locator
+from pegasus_wrapper.scripts.multiply_by_x import main as multiply_by_x_main
+
+from yaml import SafeLoader, load
 
 
 def test_composed_key_value_transform(tmp_path):
@@ -40,3 +50,53 @@ def test_composed_key_value_transform(tmp_path):
 
     expected_kvs = {"doc1": 4, "doc2": 9}
     assert expected_kvs == transformed_kvs
+
+
+def test_explicit_split_waits_for_key_lists(tmp_path):
+    params = Parameters.from_mapping(
+        {
+            "workflow_name": "Test",
+            "workflow_created": "Testing",
+            "workflow_log_dir": str(tmp_path / "log"),
+            "workflow_directory": str(tmp_path / "working"),
+            "site": "saga",
+            "namespace": "test",
+            "partition": "gaia",
+            "home_dir": str(tmp_path),
+        }
+    )
+
+    initialize_vista_pegasus_wrapper(params)
+
+    corpus = ZipKeyValueStore(tmp_path / "corpus.zip", locator=Locator(["corpus"]))
+    key_lists = {}
+    for split_name in ("train", "dev", "test"):
+        keys_file = tmp_path / f"{split_name}_keys.txt"
+        keys_job = run_python_on_parameters(
+            Locator(["keys", split_name]),
+            multiply_by_x_main,
+            Parameters.from_mapping(
+                {"input_file": tmp_path / "nums.txt", "output_file": keys_file, "x": 1}
+            ),
+            depends_on=[],
+        )
+        key_lists[split_name] = ValueArtifact(keys_file, depends_on=keys_job)
+
+    explicit_train_dev_test_split(
+        corpus,
+        train_ids=key_lists["train"],
+        dev_ids=key_lists["dev"],
+        test_ids=key_lists["test"],
+        output_locator=Locator(["split"]),
+    )
+
+    dax_file = write_workflow_description(tmp_path)
+    with dax_file.open("r") as f:
+        data = load(f, Loader=SafeLoader)
+
+    name_to_id = {job["name"]: job["id"] for job in data["jobs"]}
+    parent_to_children = {
+        dependency["id"]: dependency["children"] for dependency in data["jobDependencies"]
+    }
+    for split_name in ("train", "dev", "test"):
+        assert name_to_id["split"] in parent_to_children[name_to_id[f"keys_{split_name}"]]
@@ -8,7 +8,7 @@ from vistautils.parameters import Parameters
 from pegasus_wrapper import PegasusProfile
 from pegasus_wrapper.artifact import ValueArtifact
 from pegasus_wrapper.locator import Locator, _parse_parts
-from pegasus_wrapper.pegasus_utils import build_submit_script
+from pegasus_wrapper.pegasus_utils import build_submit_script, write_executable_script
 from pegasus_wrapper.resource_request import SlurmResourceRequest
 from pegasus_wrapper.scripts.add_y import main as add_main
 from pegasus_wrapper.scripts.multiply_by_x import main as multiply_by_x_main
@@ -47,6 +47,33 @@ def test_simple_dax(tmp_path):
     assert workflow_builder._experiment_name == "fred"  # pylint:disable=protected-access
 
 
+def test_equal_resource_requests_are_unified_once(tmp_path):
+    params = Parameters.from_mapping(
+        {
+            "workflow_name": "Test",
+            "workflow_created": "Testing",
+            "workflow_log_dir": str(tmp_path / "log"),
+            "workflow_directory": str(tmp_path / "working"),
+            "site": "saga",
+            "namespace": "test",
+            "partition": "gaia",
+            "home_dir": str(tmp_path),
+        }
+    )
+    workflow_builder = WorkflowBuilder.from_parameters(params)
+    slurm_params = Parameters.from_mapping({"partition": "gaia", "num_cpus": 2})
+
+    first = workflow_builder.set_resource_request(
+        SlurmResourceRequest.from_parameters(slurm_params)
+    )
+    second = workflow_builder.set_resource_request(
+        SlurmResourceRequest.from_parameters(slurm_params)
+    )
+
+    assert first.num_cpus == 2
+    assert first is second
+
+
 def test_locator():
     job = Locator(_parse_parts("job"))
     example = Locator(_parse_parts("example/path"))
@@ -60,6 +87,51 @@ def test_locator():
     # Confirm we can't create a locator with an equals sign in the name
     with pytest.raises(ValueError):
         _ = Locator(_parse_parts("x=20"))
+    # ... or extend one with a name containing an equals sign
+    with pytest.raises(ValueError):
+        _ = example / "x=20"
+
+    # Locators compare, hash and sort by their parts
+    assert combined == Locator(_parse_parts("example/path/job"))
+    assert hash(combined) == hash(Locator(_parse_parts("example/path/job")))
+    assert example / "a/b" != Locator(_parse_parts("example/path/a/b"))
+    assert sorted([combined, example, job]) == [example, combined, job]
+
+
+def test_write_executable_script_regenerates_executable(tmp_path):
+    script = tmp_path / "script.sh"
+    script.write_text("old content")
+    script.chmod(0o600)
+
+    write_executable_script(script, "echo new content\n")
+
+    assert script.read_text() == "echo new content\n"
+    # Owner execute is added, but group and other access is not widened.
+    assert script.stat().st_mode & 0o777 == 0o700
+
+
+def test_directory_for_stays_in_workflow_directory(tmp_path):
+    params = Parameters.from_mapping(
+        {
+            "workflow_name": "Test",
+            "workflow_created": "Testing",
+            "workflow_log_dir": str(tmp_path / "log"),
+            "workflow_directory": str(tmp_path / "working"),
+            "site": "saga",
+            "namespace": "test",
+            "partition": "gaia",
+            "home_dir": str(tmp_path),
+        }
+    )
+    workflow_builder = WorkflowBuilder.from_parameters(params)
+
+    assert workflow_builder.directory_for(Locator(["jobs"]) / "a/b") == (
+        tmp_path / "working" / "jobs" / "a" / "b"
+    )
+    for escaping_parts in (["/outside"], ["jobs", "/outside"], ["jobs", "..", ".."]):
+        with pytest.raises(ValueError):
+            workflow_builder.directory_for(Locator(escaping_parts))
+    assert not (tmp_path / "outside").exists()
 
 
 def test_dax_with_job_on_saga(tmp_path):
@@ -341,6 +413,41 @@ def test_not_clearing_ckpts(monkeypatch, tmp_path):
     assert checkpointed_multiply_file.exists()
 
 
+def test_nuke_checkpoints_removes_nested_ckpts(monkeypatch, tmp_path):
+    workflow_params = Parameters.from_mapping(
+        {
+            "workflow_name": "Test",
+            "workflow_created": "Testing",
+            "workflow_log_dir": str(tmp_path / "log"),
+            "workflow_directory": str(tmp_path / "working"),
+            "site": "saga",
+            "namespace": "test",
+            "partition": "scavenge",
+            "home_dir": str(tmp_path),
+        }
+    )
+
+    workflow_builder = WorkflowBuilder.from_parameters(workflow_params)
+
+    checkpoints = [
+        workflow_builder.directory_for(Locator(_parse_parts(name))) / "___ckpt"
+        for name in ("jobs", "jobs/multiply", "jobs/multiply/nested/deeper")
+    ]
+    for checkpoint in checkpoints:
+        checkpoint.touch()
+    other_file = checkpoints[-1].parent / "output.txt"
+    other_file.touch()
+
+    # The replica catalog is written to the current directory.
+    monkeypatch.chdir(tmp_path)
+    workflow_builder._nuke_checkpoints_and_clear_rc(  # pylint:disable=protected-access
+        tmp_path / "working"
+    )
+
+    assert not any(checkpoint.exists() for checkpoint in checkpoints)
+    assert other_file.exists()
+
+
 def _job_in_dax_has_category(dax_file, target_job_locator, category):
     """
     Return whether the given DAX file has a job
@@ -1059,3 +1166,34 @@ def test_dax_with_python_into_container_jobs(tmp_path):
     )
 
     assert submit_script_one.exists()
+
+
+def test_docker_service_mounts(tmp_path):
+    workflow_params = Parameters.from_mapping(
+        {
+            "workflow_name": "Test",
+            "workflow_created": "Testing",
+            "workflow_log_dir": str(tmp_path / "log"),
+            "workflow_directory": str(tmp_path / "working"),
+            "site": "saga",
+            "namespace": "test",
+            "partition": "gaia",
+            "home_dir": str(tmp_path),
+        }
+    )
+    workflow_builder = WorkflowBuilder.from_parameters(workflow_params)
+    mongo4_4 = workflow_builder.add_container(
+        "mongo:4.4", "docker", "path/to/tar.tar", image_site="saga", bypass_staging=True
+    )
+
+    workflow_builder.start_docker_as_service(
+        mongo4_4,
+        depends_on=[],
+        mounts=["/scratch/mongo/data/db:/data/db", "/scratch/mongo/config:/etc/custom"],
+        docker_args="-p 27017:27017",
+    )
+    mongo4_4_dir = workflow_builder.directory_for(Locator(("containers", mongo4_4.name)))
+    assert (
+        "-p 27017:27017 -v /scratch/mongo/data/db:/data/db -v /scratch/mongo/config:/etc/custom"
+        in (mongo4_4_dir / "start.sh").read_text()
+    )